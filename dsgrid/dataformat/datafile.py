@@ -226,7 +226,7 @@ class Datafile(Mapping):
         if isinstance(mapping.to_enum,SectorEnumeration):
 
             # new_sector_id : [old_sector_ids]
-            data = defaultdict(lambda: [])
+            data = defaultdict(list)
             for sector_id, sectordataset in self.sectordata.items():
                 new_sector_id = mapping.map(sector_id)
                 if isinstance(new_sector_id,list):
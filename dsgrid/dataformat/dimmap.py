@@ -16,6 +16,18 @@ from dsgrid.dataformat.enumeration import (
     sectors_subsectors,states,weekdays,weekly2012)
 
 
+def _id_series(ids):
+    # object dtype keeps tuple ids (e.g. from MultiFuelEndUseEnumerations) 
+    # as scalar elements
+    return pd.Series(list(ids),dtype=object)
+
+
+def _ids_set(enum):
+    # for O(1) membership tests. Not cached on enum because 
+    # Enumeration.__eq__ compares instance __dict__s.
+    return frozenset(enum.ids)
+
+
 class DimensionMap(object):
     def __init__(self,from_enum,to_enum):
         self.from_enum = from_enum
@@ -27,9 +39,56 @@ class DimensionMap(object):
         """
         return None
 
+    def map_array(self,from_ids):
+        """
+        Vectorized version of map.
+
+        Parameters
+        ----------
+        from_ids : list-like of from_enum.ids
+
+        Returns
+        -------
+        np.ndarray
+            object array of the same length as from_ids, containing the 
+            result of self.map for each element
+        """
+        return _id_series(from_ids).map(self.map).to_numpy()
+
+    def remap_index(self,index):
+        """
+        Maps all the ids in index at once, e.g., to relabel the columns of a 
+        DataFrame.
+
+        Parameters
+        ----------
+        index : pd.Index of from_enum.ids
+
+        Returns
+        -------
+        pd.Index
+            same length as index, with None for ids that do not map
+        """
+        return pd.Index(self.map_array(index).tolist())
+
     def scale_factor(self,from_id):
         return 1.0
 
+    def scale_factor_array(self,from_ids):
+        """
+        Vectorized version of scale_factor.
+
+        Parameters
+        ----------
+        from_ids : list-like of from_enum.ids
+
+        Returns
+        -------
+        np.ndarray
+            float array of the same length as from_ids
+        """
+        return np.ones(len(from_ids))
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self.from_enum}, {self.to_enum})"
 
@@ -41,6 +100,12 @@ class TautologyMapping(DimensionMap):
     def map(self,from_id):
         return from_id
 
+    def map_array(self,from_ids):
+        return _id_series(from_ids).to_numpy()
+
+    def remap_index(self,index):
+        return index
+
 
 class FullAggregationMap(DimensionMap):
 
@@ -63,16 +128,26 @@ class FullAggregationMap(DimensionMap):
         self.to_id = to_enum.ids[0]
 
         self.exclude_list = exclude_list
+        from_ids = _ids_set(from_enum)
         for exclude_item in self.exclude_list:
-            if exclude_item not in from_enum.ids:
+            if exclude_item not in from_ids:
                 raise DSGridError("exclude_list must contain ids in from_enum " + 
                     "that are to be exluded from the overall aggregation. "
                     "Found {} in exclude list, which is not in {}.".format(exclude_item,from_enum))
+        self._exclude_set = frozenset(self.exclude_list)
 
     def map(self,from_id):
-        if from_id in self.exclude_list:
-            return None
-        return self.to_id
+        return None if from_id in self._exclude_set else self.to_id
+
+    def map_array(self,from_ids):
+        excluded = _id_series(from_ids).isin(self._exclude_set).to_numpy()
+        return np.where(excluded,None,self.to_id)
+
+    def map_many(self,from_ids):
+        """
+        Alias of map_array.
+        """
+        return self.map_array(from_ids)
 
 
 class FilterToSubsetMap(DimensionMap):
@@ -82,28 +157,30 @@ class FilterToSubsetMap(DimensionMap):
             - to_enum (Enumeration) - should be a subset of from_enum
         """
         super().__init__(from_enum,to_enum)
-        for to_id in to_enum.ids:
-            if not to_id in from_enum.ids:
-                raise DSGridError("to_enum should be a subset of from_enum")
+        self._keep = _ids_set(to_enum)
+        if not self._keep.issubset(_ids_set(from_enum)):
+            raise DSGridError("to_enum should be a subset of from_enum")
 
     def map(self,from_id):
-        if from_id in self.to_enum.ids:
+        if from_id in self._keep:
             return from_id
         return None
 
+    def map_array(self,from_ids):
+        from_ids = _id_series(from_ids)
+        return np.where(from_ids.isin(self._keep).to_numpy(),from_ids.to_numpy(),None)
+
 
 class FilterToSingleFuelMap(DimensionMap):
     def __init__(self,from_enum,fuel_to_keep):
         assert isinstance(from_enum,MultiFuelEndUseEnumeration), "This map only applies to MultiFuelEndUseEnumerations"
-        assert fuel_to_keep in from_enum.fuel_enum.ids, "{} is not a fuel_id in {}".format(fuel_to_keep,from_enum.fuel_enum)
+        assert fuel_to_keep in _ids_set(from_enum.fuel_enum), "{} is not a fuel_id in {}".format(fuel_to_keep,from_enum.fuel_enum)
         to_enum_name = from_enum.name + " ({})".format(from_enum.fuel_enum.get_name(fuel_to_keep))
-        ids = []; names = []; self._map = {}
-        for i, id in enumerate(from_enum.ids):
-            if id[1] == fuel_to_keep:
-                ids.append(id[0]); names.append(from_enum._names[i])
-                self._map[id] = id[0]
-            else:
-                self._map[id] = None
+        keep = (np.array(from_enum._fuel_ids,dtype=object) == fuel_to_keep)
+        ids = np.array(from_enum._ids,dtype=object)[keep].tolist()
+        names = np.array(from_enum._names,dtype=object)[keep].tolist()
+        # ids for other fuels are left out and map to None
+        self._map = {(id, fuel_to_keep): id for id in ids}
         to_enum = SingleFuelEndUseEnumeration(to_enum_name,
                                               ids,names,
                                               fuel=from_enum.fuel_enum.get_name(fuel_to_keep),
@@ -111,16 +188,24 @@ class FilterToSingleFuelMap(DimensionMap):
         super().__init__(from_enum,to_enum)
 
     def map(self,from_id):
-        return self._map[from_id]
+        return self._map.get(from_id)
+
+    def map_array(self,from_ids):
+        result = _id_series(from_ids).map(self._map)
+        return result.where(result.notna(),None).to_numpy()
 
 
 class ExplicitMap(DimensionMap):
     def __init__(self,from_enum,to_enum,dictmap):
         super().__init__(from_enum,to_enum)
-        self._dictmap = defaultdict(lambda: None)
+        self._dictmap = {}
 
     def map(self,from_id):
-        return self._dictmap[from_id]
+        return self._dictmap.get(from_id)
+
+    def map_array(self,from_ids):
+        result = _id_series(from_ids).map(self._dictmap)
+        return result.where(result.notna(),None).to_numpy()
 
     @classmethod
     def create_from_csv(cls,from_enum,to_enum,filepath):
@@ -137,12 +222,12 @@ class ExplicitDisaggregation(ExplicitMap):
         If no scaling_datafile, scaling factors are assumed to be 1.0.
         """
         super().__init__(from_enum,to_enum,dictmap)
-        self._dictmap = defaultdict(lambda: [])
+        from_ids = _ids_set(self.from_enum); to_ids_set = _ids_set(self.to_enum)
         for from_id, to_ids in dictmap.items():
-            if from_id not in self.from_enum.ids:
+            if from_id not in from_ids:
                 raise DSGridError("Id {} is not in from_enum {}.".format(from_id,self.from_enum))
             for to_id in to_ids:
-                if to_id not in self.to_enum.ids:
+                if to_id not in to_ids_set:
                     raise DSGridError("Id {} is not in to_enum {}.".format(to_id,self.to_enum))
             self._dictmap[from_id] = to_ids
         # scaling_datafile must have to_enum as one of its dimensions
@@ -151,6 +236,16 @@ class ExplicitDisaggregation(ExplicitMap):
                 "because it does not contain to_enum {}.".format(repr(to_enum)))
         self._scaling_datafile = scaling_datafile
         self._scaling_datatable = None
+        self._scaling_sums = None
+
+    def map(self,from_id):
+        return self._dictmap.get(from_id,[])
+
+    def map_array(self,from_ids):
+        result = _id_series(from_ids).map(self._dictmap).to_numpy()
+        for i in np.flatnonzero(pd.isna(result)):
+            result[i] = []
+        return result
 
     @property
     def default_scaling(self):
@@ -160,7 +255,9 @@ class ExplicitDisaggregation(ExplicitMap):
     def scaling_datatable(self):
         assert not self.default_scaling
         if self._scaling_datatable is None:
-            self._scaling_datatable = Datatable(self._scaling_datafile)
+            # sorted so slicing and groupby take pandas' monotonic fast paths
+            self._scaling_datatable = Datatable(self._scaling_datafile,sort=True)
+            assert self._scaling_datatable.data.index.is_monotonic_increasing
         return self._scaling_datatable
 
     def get_scalings(self,to_ids):
@@ -170,24 +267,31 @@ class ExplicitDisaggregation(ExplicitMap):
         if self.default_scaling:
             return np.array([1.0 for to_id in to_ids]) 
 
-        if isinstance(self.to_enum,SectorEnumeration):
-            temp = self.scaling_datatable[to_ids,:,:,:]
-            temp = temp.groupby(level='sector').sum()
-        elif isinstance(self.to_enum,GeographyEnumeration):
-            temp = self.scaling_datatable[:,to_ids,:,:]
-            temp = temp.groupby(level='geography').sum()
-        elif isinstance(self.to_enum,EndUseEnumerationBase):
-            temp = self.scaling_datatable[:,:,to_ids,:]
-            temp = temp.groupby(level='enduse').sum()
-        else:
-            assert isinstance(self.to_enum,TimeEnumeration)
-            temp = self.scaling_datatable[:,:,:,to_ids]
-            temp = temp.groupby(level='time').sum()
-
+        temp = self.scaling_sums.reindex(list(to_ids))
         # fraction of from_id that should go to each to_id
         temp = temp / temp.sum()
-        result = np.array([temp[to_id] for to_id in to_ids])
-        return result
+        return temp.to_numpy()
+
+    @property
+    def scaling_sums(self):
+        """
+        Series of scaling_datatable totals per to_enum id. Computed on first 
+        use and then shared by all calls to get_scalings.
+        """
+        assert not self.default_scaling
+        if self._scaling_sums is None:
+            if isinstance(self.to_enum,SectorEnumeration):
+                level = 'sector'
+            elif isinstance(self.to_enum,GeographyEnumeration):
+                level = 'geography'
+            elif isinstance(self.to_enum,EndUseEnumerationBase):
+                level = 'enduse'
+            else:
+                assert isinstance(self.to_enum,TimeEnumeration)
+                level = 'time'
+            data = self.scaling_datatable.data
+            self._scaling_sums = data.groupby(level=level,observed=False).sum()
+        return self._scaling_sums
 
     @classmethod
     def create_from_csv(cls,from_enum,to_enum,filepath,scaling_datafile=None):
@@ -196,32 +300,57 @@ class ExplicitDisaggregation(ExplicitMap):
 
     @classmethod
     def _make_dictmap(cls,mapdata):
-        result = defaultdict(lambda: [])
-        for from_id, to_id in zip(mapdata.from_id,mapdata.to_id):
-            result[from_id].append(to_id)
-        return result
+        # sort=False keeps from_ids in file order, dropna=False keeps every row
+        return mapdata.groupby('from_id',sort=False,dropna=False)['to_id'].agg(list).to_dict()
 
 
 class ExplicitAggregation(ExplicitMap):
     def __init__(self,from_enum,to_enum,dictmap):
         super().__init__(from_enum,to_enum,dictmap)
+        from_ids = _ids_set(self.from_enum)
+        to_pos = {to_id: i for i, to_id in enumerate(self.to_enum.ids)}
         for from_id, to_id in dictmap.items():
-            if from_id not in self.from_enum.ids:
+            if from_id not in from_ids:
                 raise DSGridError("Id {} is not in from_enum {}.".format(from_id,self.from_enum))
-            if to_id not in self.to_enum.ids:
+            if to_id not in to_pos:
                 raise DSGridError("Id {} is not in to_enum {}.".format(to_id,self.to_enum))
             self._dictmap[from_id] = to_id
+        # position in to_enum.ids for each position in from_enum.ids, -1 if 
+        # unmapped
+        to_codes = _id_series(self.from_enum.ids).map(self._dictmap).map(to_pos)
+        self._to_codes = to_codes.fillna(-1).to_numpy(dtype=np.int32)
+
+    def map_codes(self,from_codes):
+        """
+        Integer-coded version of map_array.
+
+        Parameters
+        ----------
+        from_codes : np.ndarray of int
+            positions in from_enum.ids, e.g., pd.Categorical.codes for data 
+            categorized by from_enum.ids. Negative codes (missing values) 
+            map to -1.
+
+        Returns
+        -------
+        np.ndarray of np.int32
+            positions in to_enum.ids, or -1 where the from_id is missing or 
+            not mapped
+        """
+        from_codes = np.asarray(from_codes)
+        return np.where(from_codes < 0,np.int32(-1),self._to_codes[from_codes])
 
     @classmethod
     def _make_dictmap(cls,mapdata):
-        result = {}
-        from_fuel_enduse = ('from_fuel_id' in mapdata.columns)
-        to_fuel_enduse = ('to_fuel_id' in mapdata.columns)
-        for row in mapdata.itertuples(index=False):
-            from_key = (row.from_id, row.from_fuel_id) if from_fuel_enduse else row.from_id
-            to_key = (row.to_id, row.to_fuel_id) if to_fuel_enduse else row.to_id
-            result[from_key] = to_key
-        return result
+        if 'from_fuel_id' in mapdata.columns:
+            from_keys = list(zip(mapdata.from_id,mapdata.from_fuel_id))
+        else:
+            from_keys = mapdata.from_id.tolist()
+        if 'to_fuel_id' in mapdata.columns:
+            to_keys = list(zip(mapdata.to_id,mapdata.to_fuel_id))
+        else:
+            to_keys = mapdata.to_id.tolist()
+        return dict(zip(from_keys,to_keys))
 
 
 class UnitConversionMap(DimensionMap):
@@ -248,10 +377,22 @@ class UnitConversionMap(DimensionMap):
         assert len(from_units) == len(to_units), "Cannot convert {} to {} since they are of a different number".format(from_units,to_units)
         assert len(from_units) > 0, "from_units is empty. Nothing to do."
 
-        self._scale_map = defaultdict(lambda: 1.0)
+        # scale factors by position in from_enum.ids. float32 to match the data.
+        self._id_to_pos = {id: i for i, id in enumerate(from_enum.ids)}
+        self._scale_vec = np.ones(len(self._id_to_pos),dtype=np.float32)
         if isinstance(from_enum,SingleFuelEndUseEnumeration):
             assert len(from_units) == 1
             assert from_units[0] == from_enum._units
+        else:
+            assert isinstance(from_enum,MultiFuelEndUseEnumeration)
+            for from_unit in from_units:
+                assert from_unit in from_enum.fuel_enum.units, "{} is not a unit in {!r}".format(from_unit,from_enum.fuel_enum)
+
+        if list(from_units) == list(to_units):
+            # nothing to convert
+            to_enum = from_enum
+
+        elif isinstance(from_enum,SingleFuelEndUseEnumeration):
             to_enum_name = from_enum.name.replace(from_units[0],to_units[0])
             to_enum_name = to_enum_name.replace(from_units[0].lower(),to_units[0].lower())
             to_enum = SingleFuelEndUseEnumeration(to_enum_name,
@@ -259,13 +400,9 @@ class UnitConversionMap(DimensionMap):
                                                   from_enum.names,
                                                   fuel=from_enum._fuel,
                                                   units=to_units[0])
-            self._scale_map = self.scaling_factor(from_units[0],to_units[0])
+            self._scale_vec[:] = self.scaling_factor(from_units[0],to_units[0])
 
         else:
-            assert isinstance(from_enum,MultiFuelEndUseEnumeration)
-            for from_unit in from_units:
-                assert from_unit in from_enum.fuel_enum.units, "{} is not a unit in {!r}".format(from_unit,from_enum.fuel_enum)
-            
             to_fuel_enum_units = []
             for unit in from_enum.fuel_enum.units:
                 if unit in from_units:
@@ -278,15 +415,17 @@ class UnitConversionMap(DimensionMap):
                                            from_enum.fuel_enum.names,
                                            to_fuel_enum_units)
             
+            # only the units change, so share from_enum's id and name lists
             to_enum = MultiFuelEndUseEnumeration(from_enum.name,
                                                  from_enum._ids,
                                                  from_enum._names,
                                                  to_fuel_enum,
-                                                 from_enum._fuel_ids)
-            for id in from_enum.ids:
+                                                 from_enum._fuel_ids,
+                                                 share=True)
+            for id, i in self._id_to_pos.items():
                 u = from_enum.units(id)
                 if u in from_units:
-                    self._scale_map[id] = self.scaling_factor(u,to_units[from_units.index(u)])
+                    self._scale_vec[i] = self.scaling_factor(u,to_units[from_units.index(u)])
 
         super().__init__(from_enum,to_enum)
 
@@ -294,62 +433,126 @@ class UnitConversionMap(DimensionMap):
         # no change in enduse or fuel id
         return from_id
 
+    def map_array(self,from_ids):
+        return _id_series(from_ids).to_numpy()
+
+    def remap_index(self,index):
+        return index
+
     def scale_factor(self,from_id):
-        if isinstance(self._scale_map,dict):
-            return self._scale_map[from_id]
-        return self._scale_map        
+        # per-id access kept for compatibility. Prefer scale_factor_array or 
+        # scale_factors_for when scaling many ids.
+        try:
+            return float(self._scale_vec[self._id_to_pos[from_id]])
+        except KeyError:
+            raise DSGridError("Id {} is not in from_enum {}.".format(from_id,self.from_enum))
+
+    def scale_factor_array(self,from_ids):
+        from_ids = _id_series(from_ids)
+        positions = from_ids.map(self._id_to_pos)
+        unknown = positions.isna()
+        if unknown.any():
+            raise DSGridError("Ids {} are not in from_enum {}.".format(
+                from_ids[unknown].tolist(),self.from_enum))
+        return self.scale_factors_for(positions.to_numpy(dtype=int))
+
+    def scale_factors_for(self,positions):
+        """
+        Parameters
+        ----------
+        positions : np.ndarray of int
+            positions in from_enum.ids
+
+        Returns
+        -------
+        np.ndarray of np.float32
+            scale factor for each position
+        """
+        return self._scale_vec[positions]
 
     @classmethod
     def scaling_factor(cls,from_unit,to_unit):
-        key = (from_unit,to_unit)
-        these_factors = cls._get_all_factors(to_unit, cls.CONVERSION_FACTORS)
-        if key in these_factors:
-            return these_factors[key]
-
-        something_added = True
-        while something_added:
-            something_added = False
-            to_expand = [(a_key, val) for a_key, val in these_factors.items()]
-            for a_key, factor in to_expand:
-                candidates = cls._get_all_factors(a_key[0], cls.CONVERSION_FACTORS, multiplier=factor)
-                for b_key, val in candidates.items():
-                    c_key = (b_key[0], to_unit)
-                    if c_key not in these_factors:
-                        these_factors[c_key] = val
-                        something_added = True
-            if key in these_factors:
-                return these_factors[key]
-
-        raise DSGridNotImplemented("No conversion factor available to go from {} to {}.".format(from_unit,to_unit))
+        if from_unit == to_unit:
+            return 1.0
+        try:
+            return cls._closure[(from_unit,to_unit)]
+        except KeyError:
+            raise DSGridNotImplemented("No conversion factor available to go from {} to {}.".format(from_unit,to_unit))
 
     @classmethod
-    def _get_all_factors(cls, to_unit, factors, multiplier = None):
+    def _build_closure(cls):
+        """
+        Returns {(from_unit, to_unit): factor} for every pair of units 
+        connected through CONVERSION_FACTORS, forwards or backwards, 
+        including the identity conversions.
+        """
         result = {}
+        for (from_u, to_u), factor in cls.CONVERSION_FACTORS.items():
+            result[(from_u, to_u)] = factor
+            result[(to_u, from_u)] = 1.0 / factor
+        units = set(unit for key in result for unit in key)
+        for unit in units:
+            result[(unit, unit)] = 1.0
+        for k in units:
+            for i in units:
+                for j in units:
+                    if ((i,k) in result) and ((k,j) in result):
+                        result.setdefault((i,j), result[(i,k)] * result[(k,j)])
+        return result
 
-        for units, factor in factors.items():
-            from_u, to_u = units
-            # directly in factors?
-            if to_u == to_unit:
-                result[units] = factor
-        
-            # in factors backward?
-            if from_u == to_unit:
-                result[(to_u, from_u)] = 1.0 / factor
+UnitConversionMap._closure = UnitConversionMap._build_closure()
 
-        if multiplier is not None:
-            for key in result:
-                result[key] *= multiplier
-        
-        return result
+
+class _LazyMapping(object):
+    """
+    Stand-in for a DimensionMap that is created from a csv file only once it 
+    is actually requested from Mappings.
+    """
+    def __init__(self,cls,from_enum,to_enum,filepath,**kwargs):
+        self.cls = cls
+        self.from_enum = from_enum
+        self.to_enum = to_enum
+        self.filepath = filepath
+        self.kwargs = kwargs
+
+    def load(self):
+        return self.cls.create_from_csv(self.from_enum,self.to_enum,self.filepath,**self.kwargs)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.cls.__name__}, {self.from_enum}, {self.to_enum})"
 
 
 class Mappings(object):
 
     def __init__(self):
-        self._mappings = defaultdict(lambda: None)
+        # {to_enum.name: {from_enum.name: mapping}}
+        self._mappings = defaultdict(dict)
+        # {(from_enum.name, to_enum.name): (from_enum, to_enum, mapping)}
+        self._resolved = {}
+        # {to_enum.name: TautologyMapping}
+        self._tautologies = {}
 
     def add_mapping(self,mapping):
-        self._mappings[(mapping.from_enum.name,mapping.to_enum.name)] = mapping
+        # cached for the subset checks in get_mapping
+        mapping._from_ids_set = frozenset(mapping.from_enum.ids)
+        self._mappings[mapping.to_enum.name][mapping.from_enum.name] = mapping
+        self._resolved.clear()
+
+    def add_lazy(self,cls,from_enum,to_enum,filepath,**kwargs):
+        """
+        Register a mapping that will be created by 
+        cls.create_from_csv(from_enum,to_enum,filepath,**kwargs) the first 
+        time it is returned by get_mapping.
+        """
+        self.add_mapping(_LazyMapping(cls,from_enum,to_enum,filepath,**kwargs))
+
+    def _materialize(self,mapping):
+        if not isinstance(mapping,_LazyMapping):
+            return mapping
+        result = mapping.load()
+        result._from_ids_set = mapping._from_ids_set
+        self._mappings[result.to_enum.name][result.from_enum.name] = result
+        return result
 
     def get_mapping(self,datafile,to_enum):
         
@@ -365,32 +568,49 @@ class Mappings(object):
         else:
             raise DSGridError("to_enum {} is not a recognized enumeration type.".format(repr(to_enum)))
 
+        # Is the requested mapping a tautology? (equal enums have equal names)
+        if (from_enum is to_enum) or ((from_enum.name == to_enum.name) and (from_enum == to_enum)):
+            return self._tautology(to_enum)
+
         key = (from_enum.name,to_enum.name)
-        if key in self._mappings:
-            return self._mappings[key]
+        if key in self._resolved:
+            # names are not guaranteed unique (e.g. subset enumerations), so 
+            # confirm that the cached result was for these same enumerations
+            cached_from, cached_to, mapping = self._resolved[key]
+            if ((cached_from is from_enum) or (cached_from == from_enum)) and \
+               ((cached_to is to_enum) or (cached_to == to_enum)):
+                return mapping
+        mapping = self._find_mapping(from_enum,to_enum)
+        self._resolved[key] = (from_enum,to_enum,mapping)
+        return mapping
+
+    def _find_mapping(self,from_enum,to_enum):
+        candidates = self._mappings.get(to_enum.name,{})
+        if from_enum.name in candidates:
+            return self._materialize(candidates[from_enum.name])
 
         # No immediate match
-        # Is the requested mapping a tautology?
-        if from_enum == to_enum:
-            return TautologyMapping(to_enum)
+        # Is from_enum a subset of to_enum, so nothing needs to be mapped?
         if from_enum.is_subset(to_enum):
-            return TautologyMapping(to_enum)
+            return self._tautology(to_enum)
         # Are elements in from_enum a subset of a stored mapping.from_enum?
-        candidates = [mapping for key, mapping in self._mappings.items() if key[1] == to_enum.name]
-        for candidate in candidates:
-            okay = True
-            for from_id in from_enum.ids:
-                if from_id not in candidate.from_enum.ids:
-                    okay = False
-                    break
-            if okay:
-                return candidate
+        from_ids = frozenset(from_enum.ids)
+        for candidate in candidates.values():
+            if from_ids.issubset(candidate._from_ids_set):
+                return self._materialize(candidate)
         return None
 
+    def _tautology(self,to_enum):
+        mapping = self._tautologies.get(to_enum.name)
+        if (mapping is None) or not ((mapping.to_enum is to_enum) or (mapping.to_enum == to_enum)):
+            mapping = TautologyMapping(to_enum)
+            self._tautologies[to_enum.name] = mapping
+        return mapping
+
 mappings = Mappings()
 
 # key geography
-mappings.add_mapping(ExplicitAggregation.create_from_csv(counties,states,os.path.join(enumdata_folder,'counties_to_states.csv')))
+mappings.add_lazy(ExplicitAggregation,counties,states,os.path.join(enumdata_folder,'counties_to_states.csv'))
 conus_states_list = pd.read_csv(os.path.join(enumdata_folder,'conus_to_states.csv'),dtype=str)['to_id'].tolist()
 mappings.add_mapping(FullAggregationMap(states,conus,exclude_list=[state_id for state_id in states.ids if state_id not in conus_states_list]))
 # full aggregations
@@ -406,15 +626,15 @@ mappings.add_mapping(FullAggregationMap(enduses,allenduses))
 mappings.add_mapping(FilterToSubsetMap(states,conus_states))
 mappings.add_mapping(FilterToSubsetMap(counties,conus_counties))
 # then go back to vanilla enumerations
-mappings.add_mapping(ExplicitAggregation.create_from_csv(conus_states,states,os.path.join(enumdata_folder,'conus_states_to_states.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(conus_counties,counties,os.path.join(enumdata_folder,'conus_counties_to_counties.csv')))
+mappings.add_lazy(ExplicitAggregation,conus_states,states,os.path.join(enumdata_folder,'conus_states_to_states.csv'))
+mappings.add_lazy(ExplicitAggregation,conus_counties,counties,os.path.join(enumdata_folder,'conus_counties_to_counties.csv'))
 # explicit aggregations
-mappings.add_mapping(ExplicitAggregation.create_from_csv(hourly2012,daily2012,os.path.join(enumdata_folder,'hourly2012_to_daily2012.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(hourly2012,weekly2012,os.path.join(enumdata_folder,'hourly2012_to_weekly2012.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(hourly2012,seasons,os.path.join(enumdata_folder,'hourly2012_to_seasons.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(daily2012,weekly2012,os.path.join(enumdata_folder,'daily2012_to_weekly2012.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(daily2012,seasons,os.path.join(enumdata_folder,'daily2012_to_seasons.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(enduses,fuel_types,os.path.join(enumdata_folder,'enduses_to_fuel_types.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(states,loss_state_groups,os.path.join(enumdata_folder,'states_to_loss_state_groups.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(states,census_divisions,os.path.join(enumdata_folder,'states_to_census_divisions.csv')))
-mappings.add_mapping(ExplicitAggregation.create_from_csv(census_divisions,census_regions,os.path.join(enumdata_folder,'census_divisions_to_census_regions.csv')))
+mappings.add_lazy(ExplicitAggregation,hourly2012,daily2012,os.path.join(enumdata_folder,'hourly2012_to_daily2012.csv'))
+mappings.add_lazy(ExplicitAggregation,hourly2012,weekly2012,os.path.join(enumdata_folder,'hourly2012_to_weekly2012.csv'))
+mappings.add_lazy(ExplicitAggregation,hourly2012,seasons,os.path.join(enumdata_folder,'hourly2012_to_seasons.csv'))
+mappings.add_lazy(ExplicitAggregation,daily2012,weekly2012,os.path.join(enumdata_folder,'daily2012_to_weekly2012.csv'))
+mappings.add_lazy(ExplicitAggregation,daily2012,seasons,os.path.join(enumdata_folder,'daily2012_to_seasons.csv'))
+mappings.add_lazy(ExplicitAggregation,enduses,fuel_types,os.path.join(enumdata_folder,'enduses_to_fuel_types.csv'))
+mappings.add_lazy(ExplicitAggregation,states,loss_state_groups,os.path.join(enumdata_folder,'states_to_loss_state_groups.csv'))
+mappings.add_lazy(ExplicitAggregation,states,census_divisions,os.path.join(enumdata_folder,'states_to_census_divisions.csv'))
+mappings.add_lazy(ExplicitAggregation,census_divisions,census_regions,os.path.join(enumdata_folder,'census_divisions_to_census_regions.csv'))
@@ -113,10 +113,7 @@ class Enumeration(object):
         """
         if not isinstance(other_enum,self.__class__):
             return False
-        for my_id in self.ids:
-            if not (my_id in other_enum.ids):
-                return False
-        return True
+        return set(self.ids).issubset(other_enum.ids)
 
     def persist(self, h5group):
 
@@ -667,14 +664,33 @@ class MultiFuelEndUseEnumeration(EndUseEnumerationBase):
         ("fuel_id", "S" + str(Enumeration.max_id_len))
     ])
 
-    def __init__(self, name, ids, names, fuel_enum, fuel_ids):
+    def __init__(self, name, ids, names, fuel_enum, fuel_ids, share=False):
+        """
+        Parameters
+        ----------
+        name : str
+        ids : list of str
+            end-use ids, not including the fuel
+        names : list of str
+        fuel_enum : FuelEnumeration
+        fuel_ids : list of str
+            fuel_enum id for each element of ids
+        share : bool
+            If True, ids, names, and fuel_ids are the lists of an existing, 
+            already validated MultiFuelEndUseEnumeration. They are shared by 
+            reference (and so must not be modified), and only their 
+            consistency with fuel_enum is checked.
+        """
         self.name = name
         self._ids = ids
         self._names = names
         self.fuel_enum = fuel_enum
         self._fuel_ids = fuel_ids
 
-        self.checkvalues()
+        if share:
+            self._check_fuel_enum()
+        else:
+            self.checkvalues()
         return
 
     def __str__(self):
@@ -682,7 +698,7 @@ class MultiFuelEndUseEnumeration(EndUseEnumerationBase):
             f"[{self._names[0]}, ...], {self.fuel_enum}, [{self._fuel_ids[0]}, ...])")
 
     def checkvalues(self):
-        ids = self._ids; fuel_ids = self._fuel_ids; fuel_enum = self.fuel_enum
+        ids = self._ids; fuel_ids = self._fuel_ids
         n_ids = len(ids); n_fuel_ids = len(fuel_ids)
 
         # make sure fuel_ids is as long as ids
@@ -690,6 +706,15 @@ class MultiFuelEndUseEnumeration(EndUseEnumerationBase):
             raise DSGridValueError("Number of fuel ids (" + str(n_fuel_ids) +
                 ") must match number of ids (" + str(n_ids) + ")")
 
+        self._check_fuel_enum()
+
+        super(MultiFuelEndUseEnumeration, self).checkvalues()
+
+        return
+
+    def _check_fuel_enum(self):
+        fuel_ids = self._fuel_ids; fuel_enum = self.fuel_enum
+
         if not isinstance(fuel_enum,FuelEnumeration):
             raise DSGridValueError("The fuel_enum must be of type " +
                 "{}, but is instead of type {}".format(FuelEnumeration.__class__,
@@ -701,10 +726,6 @@ class MultiFuelEndUseEnumeration(EndUseEnumerationBase):
                 raise DSGridValueError("The fuel_ids must each be an id in the fuel_enum." +
                     "fuel_id: {}, fuel_enum.ids: {}".format(fuel_id,fuel_enum.ids))
 
-        super(MultiFuelEndUseEnumeration, self).checkvalues()
-
-        return
-
     @property
     def ids(self):
         return list(zip(self._ids,self._fuel_ids))
@@ -644,13 +644,12 @@ class SectorDataset(object):
             from_geo_map = geo_datamap.get_map(self.datafile.geo_enum) # dataset_geo_index: (geo_ids, scalings) in THIS dataset
             to_geo_map = OrderedDict()                                 # DITTO, but for mapped dataset, ignoring aggregation for now
             # new_geo_id: [dataset_geo_indices] so can see what aggregation needs to be done
-            new_geo_ids_to_dataset_geo_index_map = defaultdict(lambda: [])
+            new_geo_ids_to_dataset_geo_index_map = defaultdict(list)
             for dataset_geo_index in from_geo_map:
                 geo_ids, scalings = from_geo_map[dataset_geo_index]
                 new_geo_ids = []
                 new_scalings = []
-                for i, geo_id in enumerate(geo_ids):
-                    new_geo_id = mapping.map(geo_id)
+                for i, new_geo_id in enumerate(mapping.map_array(geo_ids)):
                     if new_geo_id is None:
                         # filtering out; moving on
                         continue
@@ -740,7 +739,7 @@ class SectorDataset(object):
 
                 # apply the mapping
                 cols = df.columns
-                df[mapping.to_enum.name] = df.index.to_series().apply(mapping.map)
+                df[mapping.to_enum.name] = mapping.map_array(df.index)
                 # filter out unmapped items
                 df = df[~(df[mapping.to_enum.name] == None)]
                 df = df.pivot_table(index=mapping.to_enum.name,
@@ -764,12 +763,13 @@ class SectorDataset(object):
                 df, geo_ids, scalings = self.get_data(i)
 
                 # apply scaling (for unit conversion)
-                for col in df.columns:
-                    if not (mapping.scale_factor(col) == 1.0):
-                        df[col] = df[col] * mapping.scale_factor(col)
+                scales = mapping.scale_factor_array(df.columns)
+                if not (scales == 1.0).all():
+                    # keep the data in float32
+                    df = df * scales.astype(df.dtypes.iloc[0])
 
                 # apply the mapping
-                df.columns = [mapping.map(col) for col in df.columns]
+                df.columns = mapping.remap_index(df.columns)
                 # filter out unmapped items
                 df = df.iloc[:,[i for i, col in enumerate(df.columns) if col is not None]]
                 df = df.groupby(df.columns,axis=1).sum()
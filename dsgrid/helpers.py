@@ -1,19 +1,10 @@
 import h5py
 import numpy as np
-import pandas as pds
 import webcolors
 
 
 def multi_index(df, cols):
-    result = df.copy()
-    if len(cols) == 1:
-        result.index = result[cols[0]]
-    else:
-        result.index = pds.MultiIndex.from_tuples(list(zip(*[result[col].tolist() for col in cols])),
-                                                  names = cols)
-    for col in cols:
-        del result[col]
-    return result  
+    return df.set_index(list(cols), drop=True)
 
 
 def ensure_enum(cls, val):
@@ -44,9 +35,10 @@ def lighten_color(hex_color,fraction_to_white):
     
 
 def palette(hex_color,n,max_fraction=0.75):
-    result = []; step = max_fraction / float(n)
-    for frac in [i * step for i in range(n)]:
-        result.append(lighten_color(hex_color,frac))
+    rgb_color = np.array(webcolors.hex_to_rgb(hex_color),dtype=np.float64)
+    fractions = np.linspace(0.0,max_fraction,n,endpoint=False).reshape(-1,1)
+    colors = np.round(rgb_color + (255.0 - rgb_color) * fractions).astype(int)
+    result = [webcolors.rgb_to_hex(tuple(color)) for color in colors.tolist()]
     assert len(result) == n
     return result
 
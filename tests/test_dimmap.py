@@ -0,0 +1,157 @@
+import os
+from py.test import raises
+
+import numpy as np
+import pandas as pd
+
+from dsgrid import DSGridError, DSGridNotImplemented
+from dsgrid.dataformat.datafile import Datafile
+from dsgrid.dataformat.dimmap import (
+    mappings, ExplicitAggregation, ExplicitDisaggregation, FilterToSubsetMap, 
+    FullAggregationMap, TautologyMapping, UnitConversionMap)
+from dsgrid.dataformat.enumeration import (
+    census_divisions, conus, conus_states, counties, enduses, hourly2012, 
+    sectors_subsectors, states, enumdata_folder, GeographyEnumeration, 
+    MultiFuelEndUseEnumeration, SingleFuelEndUseEnumeration)
+from .temppaths import TempFilepath
+
+
+def check_map_array(mapping, from_ids):
+    result = mapping.map_array(from_ids)
+    assert len(result) == len(from_ids)
+    for from_id, to_id in zip(from_ids, result):
+        assert to_id == mapping.map(from_id)
+    index = mapping.remap_index(pd.Index(from_ids, tupleize_cols=False))
+    assert len(index) == len(from_ids)
+    for from_id, to_id in zip(from_ids, index):
+        assert to_id == mapping.map(from_id)
+
+
+def test_map_array():
+    for to_mappings in mappings._mappings.values():
+        for mapping in to_mappings.values():
+            mapping = mappings._materialize(mapping)
+            check_map_array(mapping, list(mapping.from_enum.ids))
+
+    check_map_array(TautologyMapping(states), states.ids)
+    check_map_array(FilterToSubsetMap(states, conus_states), states.ids)
+    full_agg = FullAggregationMap(states, conus_states.create_subset_enum(['CO']),
+                                  exclude_list=['AK', 'HI'])
+    check_map_array(full_agg, states.ids)
+    assert list(full_agg.map_many(states.ids)) == list(full_agg.map_array(states.ids))
+
+    disagg = ExplicitDisaggregation(census_divisions, states,
+                                    {'mountain': ['CO', 'UT'], 'pacific': ['CA']})
+    check_map_array(disagg, census_divisions.ids)
+    assert disagg.map('new_england') == []
+
+
+def test_get_scalings():
+    with TempFilepath() as filepath:
+        datafile = Datafile(filepath, sectors_subsectors, states, enduses, hourly2012)
+        data = pd.DataFrame({'heating': np.ones(len(hourly2012.ids))},
+                            index=pd.CategoricalIndex(hourly2012.ids),
+                            dtype="float32")
+        sector = datafile.add_sector("com__Laboratory", ['heating'])
+        sector.add_data(data, ["CO", "UT", "CA"], [1.0, 3.0, 6.0])
+
+        disagg = ExplicitDisaggregation(census_divisions, states,
+                                        {'mountain': ['CO', 'UT'], 'pacific': ['CA']},
+                                        scaling_datafile=datafile)
+        assert np.allclose(disagg.get_scalings(['CO', 'UT']), [0.25, 0.75])
+        assert np.allclose(disagg.get_scalings(['UT', 'CO']), [0.75, 0.25])
+        assert np.allclose(disagg.get_scalings(['CA']), [1.0])
+
+
+def test_unit_scaling_factor():
+    assert UnitConversionMap.scaling_factor('kWh', 'kWh') == 1.0
+    assert UnitConversionMap.scaling_factor('kBtu', 'kBtu') == 1.0
+    assert UnitConversionMap.scaling_factor('kWh', 'MWh') == 1.0E-3
+    assert np.isclose(UnitConversionMap.scaling_factor('kWh', 'TWh'), 1.0E-9)
+    assert np.isclose(UnitConversionMap.scaling_factor('TWh', 'MWh'), 1.0E6)
+    raises(DSGridNotImplemented, UnitConversionMap.scaling_factor, 'kWh', 'therm')
+
+
+def test_unit_conversion_scales():
+    comstock_enduses = MultiFuelEndUseEnumeration.read_csv(
+        os.path.join(enumdata_folder,'comstock_enduses.csv'),
+        'ComStock Enduses')
+    mapping = UnitConversionMap(comstock_enduses, ['kWh'], ['MWh'])
+    assert mapping.to_enum._ids is comstock_enduses._ids
+    assert mapping.to_enum.fuel_enum.units[0] == 'MWh'
+    scales = mapping.scale_factor_array(comstock_enduses.ids)
+    for _id, scale in zip(comstock_enduses.ids, scales):
+        # scale factors are stored in float32, like the data they scale
+        expected = np.float32(1.0E-3) if comstock_enduses.units(_id) == 'kWh' else 1.0
+        assert scale == expected
+        assert mapping.scale_factor(_id) == expected
+
+    raises(DSGridError, mapping.scale_factor, ('bogus_enduse', 'electricity'))
+    raises(DSGridError, mapping.scale_factor_array,
+           comstock_enduses.ids[:1] + [('bogus_enduse', 'electricity')])
+
+    mapping = UnitConversionMap(comstock_enduses, ['kWh', 'kBtu'], ['kWh', 'kBtu'])
+    assert mapping.to_enum is comstock_enduses
+    assert (mapping.scale_factor_array(comstock_enduses.ids) == 1.0).all()
+
+    # units must match from_enum even when there is nothing to convert
+    raises(AssertionError, UnitConversionMap, comstock_enduses, ['MWh'], ['MWh'])
+    kwh_enduses = SingleFuelEndUseEnumeration('kWh Enduses', ['heating'], ['Heating'],
+                                              units='kWh')
+    raises(AssertionError, UnitConversionMap, kwh_enduses, ['MWh'], ['MWh'])
+    assert UnitConversionMap(kwh_enduses, ['kWh'], ['kWh']).to_enum is kwh_enduses
+
+
+class EnumHolder(object):
+    def __init__(self, sector_enum, geo_enum, enduse_enum, time_enum):
+        self.sector_enum = sector_enum
+        self.geo_enum = geo_enum
+        self.enduse_enum = enduse_enum
+        self.time_enum = time_enum
+
+
+def test_get_mapping():
+    datafile = EnumHolder(sectors_subsectors, conus_states, enduses, hourly2012)
+
+    mapping = mappings.get_mapping(datafile, states)
+    assert isinstance(mapping, ExplicitAggregation)
+    assert mapping.from_enum is conus_states
+
+    # conus_states is not registered, but its ids are a subset of states
+    mapping = mappings.get_mapping(datafile, conus)
+    assert isinstance(mapping, FullAggregationMap)
+    assert mapping.from_enum is states
+
+    mapping = mappings.get_mapping(datafile, hourly2012)
+    assert isinstance(mapping, TautologyMapping)
+    assert mappings.get_mapping(datafile, hourly2012) is mapping
+
+    assert mappings.get_mapping(datafile, counties) is None
+
+    # results are cached, but only for the same enumerations
+    mapping = mappings.get_mapping(datafile, conus)
+    assert mappings.get_mapping(datafile, conus) is mapping
+    datafile.geo_enum = GeographyEnumeration('geo', ['CO'], ['Colorado'])
+    assert mappings.get_mapping(datafile, conus) is mapping
+    datafile.geo_enum = GeographyEnumeration('geo', ['08001'], ['Adams County'])
+    assert mappings.get_mapping(datafile, conus) is None
+
+
+def test_map_codes():
+    mapping = mappings.get_mapping(
+        EnumHolder(sectors_subsectors, states, enduses, hourly2012), census_divisions)
+    codes = mapping.map_codes(np.arange(len(states.ids)))
+    assert codes.dtype == np.int32
+    for from_id, code in zip(states.ids, codes):
+        to_id = mapping.map(from_id)
+        if to_id is None:
+            assert code == -1
+        else:
+            assert census_divisions.ids[code] == to_id
+
+    # missing values in pd.Categorical.codes are -1 and stay unmapped
+    codes = mapping.map_codes(pd.Categorical(['CO', None, 'CA'], categories=states.ids).codes)
+    assert codes.dtype == np.int32
+    assert codes[1] == -1
+    assert census_divisions.ids[codes[0]] == mapping.map('CO')
+    assert census_divisions.ids[codes[2]] == mapping.map('CA')
@@ -10,10 +10,12 @@ import numpy as np
 import pandas as pd
 
 from dsgrid.dataformat.datafile import Datafile
+from dsgrid.dataformat.dimmap import mappings, UnitConversionMap
 from dsgrid.dataformat.sectordataset import SectorDataset
 from dsgrid.dataformat.enumeration import (
     annual, sectors_subsectors, counties, enduses, hourly2012,
-    enumdata_folder, MultiFuelEndUseEnumeration
+    enumdata_folder, MultiFuelEndUseEnumeration, SingleFuelEndUseEnumeration, 
+    allenduses, census_divisions, daily2012, states
 )
 from .temppaths import TempFilepath
 
@@ -84,3 +86,81 @@ def test_sectordataset_io():
         pd.testing.assert_frame_equal(dataset["01005"], zerodata, check_like=True)
         pd.testing.assert_frame_equal(dataset["56043"], zerodata, check_like=True)
         pd.testing.assert_frame_equal(dataset["56045"], data, check_like=True)
+
+
+def make_mapping_data(filepath, enduse_enum=enduses, columns=("heating", "cooling")):
+    columns = list(columns)
+    np.random.seed(0)
+    data = pd.DataFrame(np.random.rand(len(hourly2012), len(columns)),
+                        dtype='float32',
+                        columns=pd.Index(columns, tupleize_cols=False),
+                        index=hourly2012.ids)
+    datafile = Datafile(filepath, sectors_subsectors, states, enduse_enum, hourly2012)
+    dataset = datafile.add_sector("com__Laboratory", columns)
+    dataset.add_data(data, ["CO", "UT"], [1.0, 2.0])
+    dataset["CA"] = data
+    return datafile, data
+
+
+def test_map_dimension_geography():
+    with TempFilepath() as filepath, TempFilepath() as mapped_filepath:
+        datafile, data = make_mapping_data(filepath)
+        mapping = mappings.get_mapping(datafile, census_divisions)
+        dataset = datafile.map_dimension(mapped_filepath, mapping)["com__Laboratory"]
+
+        # CO and UT aggregate into mountain
+        assert np.allclose(dataset["mountain"], data * 3.0)
+        assert np.allclose(dataset["pacific"], data)
+        pd.testing.assert_frame_equal(dataset["new_england"], data * 0.0, check_like=True)
+
+
+def test_map_dimension_time():
+    with TempFilepath() as filepath, TempFilepath() as mapped_filepath:
+        datafile, data = make_mapping_data(filepath)
+        mapping = mappings.get_mapping(datafile, daily2012)
+        dataset = datafile.map_dimension(mapped_filepath, mapping)["com__Laboratory"]
+
+        expected = data.groupby([mapping.map(_id) for _id in data.index]).sum()
+        result = dataset["CA"]
+        assert len(result) == len(daily2012.ids)
+        assert np.allclose(result.loc[expected.index, expected.columns], expected)
+
+
+def test_map_dimension_enduses():
+    with TempFilepath() as filepath, TempFilepath() as mapped_filepath:
+        datafile, data = make_mapping_data(filepath)
+        mapping = mappings.get_mapping(datafile, allenduses)
+        dataset = datafile.map_dimension(mapped_filepath, mapping)["com__Laboratory"]
+
+        assert dataset.enduses == ["All"]
+        assert np.allclose(dataset["CA"]["All"], data.sum(axis=1))
+
+
+def test_map_dimension_unit_conversion():
+    kwh_enduses = SingleFuelEndUseEnumeration('kWh Enduses', ['heating', 'cooling'],
+                                              ['Heating', 'Cooling'], units='kWh')
+    with TempFilepath() as filepath, TempFilepath() as mapped_filepath:
+        datafile, data = make_mapping_data(filepath, enduse_enum=kwh_enduses)
+        mapping = UnitConversionMap(kwh_enduses, ['kWh'], ['MWh'])
+        dataset = datafile.map_dimension(mapped_filepath, mapping)["com__Laboratory"]
+
+        result = dataset["CA"][data.columns]
+        assert (result.dtypes == np.float32).all()
+        assert np.array_equal(result.values, data.values * np.float32(1.0E-3))
+
+    comstock_enduses = MultiFuelEndUseEnumeration.read_csv(
+        os.path.join(enumdata_folder,'comstock_enduses.csv'),
+        'ComStock Enduses')
+    with TempFilepath() as filepath, TempFilepath() as mapped_filepath:
+        datafile, data = make_mapping_data(filepath, enduse_enum=comstock_enduses,
+                                           columns=comstock_enduses.ids)
+        mapping = UnitConversionMap(comstock_enduses, ['kWh'], ['MWh'])
+        dataset = datafile.map_dimension(mapped_filepath, mapping)["com__Laboratory"]
+
+        # only the kWh columns are converted
+        result = dataset["CA"]
+        for _id in comstock_enduses.ids:
+            expected = data[_id].values
+            if comstock_enduses.units(_id) == 'kWh':
+                expected = expected * np.float32(1.0E-3)
+            assert np.array_equal(result[_id].values, expected)